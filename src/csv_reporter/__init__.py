@@ -4,21 +4,34 @@ CSV Rating Reporter package initializer.
 Назначение:
 - Гарантированно экспортирует __version__ (используется тестами и флагом --version).
 - Не выполняет побочных эффектов (логирование/CLI не конфигурируется здесь).
+- Версия резолвится лениво (PEP 562): чтение метаданных дистрибутива происходит
+  только при первом обращении к `__version__`, а не при каждом `import csv_reporter`.
 """
 
 from __future__ import annotations
 
+__all__ = ["__version__"]
+
 # Фолбэк-версия должна соответствовать [project].version из pyproject.toml
-__version__ = "1.0.0"  # будет переопределена, если найдём метаданные пакета
+_FALLBACK_VERSION = "1.0.0"
 
-try:
-    # Python 3.8+: способ получить версию установленного дистрибутива
-    from importlib.metadata import version as _dist_version  # type: ignore
+# Имя дистрибутива берём из pyproject.toml -> [project].name
+_DIST_NAME = "csv-rating-reporter"
 
-    # Имя дистрибутива берём из pyproject.toml -> [project].name
-    __version__ = _dist_version("csv-rating-reporter")
-except Exception:
-    # Нет метаданных / пакет ещё не установлен — оставляем фолбэк
-    pass
 
-__all__ = ["__version__"]
+def __getattr__(name: str) -> str:
+    """Лениво вычислить `__version__` и закешировать его в globals модуля."""
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from importlib.metadata import version as _dist_version
+
+        value = _dist_version(_DIST_NAME)
+    except Exception:
+        # Нет метаданных / пакет ещё не установлен — оставляем фолбэк
+        value = _FALLBACK_VERSION
+
+    # Кешируем: последующие обращения не доходят до __getattr__
+    globals()["__version__"] = value
+    return value
@@ -7,29 +7,21 @@ Domain aggregation logic (brand-level stats).
 
 Публичное API:
 - class AggregatorService:
-    - compute_brand_avg_rating(dataset: Dataset) -> list[BrandStats]
+    - compute_brand_avg_rating(dataset: Iterable[Product]) -> list[BrandStats]
 
 Правила (инварианты):
 - Среднее считается только по валидным рейтингам (rating != None), диапазон [0..5] уже гарантирован нормализатором.
 - Колонка `items` — количество записей с валидным рейтингом, вошедших в среднее.
+- Вход — любой итерируемый набор Product (Dataset или поток из CSVReader.iter_products);
+  проход один, состояние — O(число брендов).
 """
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .errors import DataError
-from .model import BrandStats, Dataset, Product
-
-
-@dataclass(slots=True)
-class _Acc:
-    """Внутренний аккумулятор для суммирования рейтингов по бренду."""
-
-    sum_ratings: float = 0.0
-    count: int = 0
+from .model import BrandStats, Product
 
 
 class AggregatorService:
@@ -43,19 +35,24 @@ class AggregatorService:
     - DIP: зависимостей от внешних сервисов нет; для тестов легко подменять входной Dataset.
     """
 
-    def compute_brand_avg_rating(self, dataset: Dataset) -> List[BrandStats]:
+    def compute_brand_avg_rating(self, dataset: Iterable[Product]) -> List[BrandStats]:
         """
         Сгруппировать продукты по бренду и посчитать средний рейтинг.
 
         Args:
-            dataset: Набор продуктов.
+            dataset: Набор продуктов (Dataset или однопроходный поток).
         Returns:
             list[BrandStats]: По одному элементу на бренд.
         Raises:
             DataError: Если во входных данных обнаружен рейтинг вне диапазона [0..5]
                        (дополнительная защитная проверка; не должна срабатывать при корректном нормализаторе).
         """
-        acc: Dict[str, _Acc] = {}
+        # Бренд -> плотный целочисленный id (аналог np.unique(..., return_inverse=True)),
+        # суммы и счётчики — параллельные списки по id (аналог np.bincount).
+        # Так в горячем цикле один поиск в словаре на строку, остальное — индексация списков.
+        brand_ids: Dict[str, int] = {}
+        sums: List[float] = []
+        counts: List[int] = []
 
         for p in dataset:
             # Объяснение: нормализация выполнялась раньше; здесь — только аккуратная агрегация.
@@ -67,19 +64,21 @@ class AggregatorService:
             if not (0.0 <= rating <= 5.0):
                 raise DataError(f"Invariant violated: rating out of range [0, 5]: {rating}")
 
-            bucket = acc.setdefault(p.brand, _Acc())
-            # Используем math.fsum для численной устойчивости при суммировании большого числа элементов.
-            bucket.sum_ratings = math.fsum([bucket.sum_ratings, rating])
-            bucket.count += 1
-
-        # Преобразуем аккумуляторы в DTO BrandStats
-        out: List[BrandStats] = []
-        for brand, bucket in acc.items():
-            if bucket.count == 0:
-                # Теоретически мы не создаём пустые бакеты, но оставим явную проверку.
-                continue
-            avg = bucket.sum_ratings / bucket.count
-            out.append(BrandStats(brand=brand, avg_rating=avg, items=bucket.count))
+            bid = brand_ids.get(p.brand)
+            if bid is None:
+                bid = brand_ids[p.brand] = len(sums)
+                sums.append(0.0)
+                counts.append(0)
+            # Рейтинги ограничены [0..5], так что погрешность обычной суммы пренебрежимо мала.
+            sums[bid] += rating
+            counts[bid] += 1
+
+        # Преобразуем суммы в DTO BrandStats; id выдаётся только бренду с валидным рейтингом,
+        # поэтому count всегда > 0.
+        out: List[BrandStats] = [
+            BrandStats(brand=brand, avg_rating=sums[bid] / counts[bid], items=counts[bid])
+            for brand, bid in brand_ids.items()
+        ]
 
         # Сортировку по умолчанию (например, по убыванию среднего) делаем в presenter,
         # чтобы не смешивать обязанности (SRP). Здесь возвращаем "как есть".
@@ -21,20 +21,20 @@ Command-line interface for CSV Rating Reporter.
 Компромиссы:
 - DIP — внедряем зависимости явно параметрами/локальными инстансами (без DI-контейнера).
 - OCP — набор отчётов расширяем через ReportRegistry, CLI остаётся неизменным.
+- Слои (reader/presenter/registry) импортируются лениво внутри run() — быстрый старт для --version.
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from . import __version__
-from .csv_reader import CSVReader
 from .errors import CsvReporterError
 from .logging_utils import get_logger, set_up_logging
-from .presenter import SortField, TablePresenter
-from .reports.registry import get_default_registry
+
+if TYPE_CHECKING:
+    from .presenter import SortField
 
 _LOG = get_logger(__name__)
 
@@ -114,11 +114,24 @@ def run(argv: Optional[List[str]] = None) -> int:
     Returns:
         int: 0 при успехе, 1 при ошибке.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Самый частый "служебный" вызов — ровно `--version`: отвечаем, не строя argparse-парсер.
+    if argv == ["--version"]:
+        from . import __version__
+
+        print(__version__)
+        return 0
+
     parser = _build_parser()
     args = parser.parse_args(argv)
 
     # Быстрый выход по версии — удобно в CI и скриптах.
     if args.version:
+        # Импорт здесь: версия резолвится лениво (PEP 562) только когда она нужна.
+        from . import __version__
+
         print(__version__)
         return 0
 
@@ -140,15 +153,19 @@ def run(argv: Optional[List[str]] = None) -> int:
     tablefmt: str = args.tablefmt
     report_name: str = args.report
 
-    try:
-        # 1) Читаем и нормализуем CSV → Dataset
-        reader = CSVReader()
-        dataset = reader.load(files)
+    # Ленивые импорты: --version/--help не должны платить за csv, tabulate и реестр отчётов.
+    from .csv_reader import CSVReader
+    from .presenter import TablePresenter
+    from .reports.registry import get_default_registry
 
-        # 2) Получаем отчёт из реестра и генерируем агрегированные DTO
+    try:
+        # 1) Получаем отчёт из реестра (до чтения файлов — неизвестное имя отсекаем сразу)
         registry = get_default_registry()
         report = registry.create(report_name)
-        stats = report.generate(dataset)
+
+        # 2) Потоково читаем CSV и сразу агрегируем: Dataset целиком не материализуем
+        reader = CSVReader()
+        stats = report.generate(reader.iter_products(files))
 
         # 3) Форматируем и печатаем таблицу
         presenter = TablePresenter()
@@ -16,7 +16,7 @@ from __future__ import annotations
 import logging
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 def set_up_logging(debug: bool = False) -> None:
@@ -55,7 +55,7 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogTimer:
     """
     Context manager for timing code sections and logging duration.
@@ -70,27 +70,30 @@ class LogTimer:
         level: Уровень логирования (по умолчанию INFO).
 
     Поведение:
-        - В __enter__ запоминаем perf_counter().
-        - В __exit__ логируем длительность в миллисекундах.
+        - В __enter__ запоминаем perf_counter() (без записи в лог).
+        - В __exit__ логируем длительность в миллисекундах, только если уровень включён.
     """
 
     logger: logging.Logger
     label: str
     level: int = logging.INFO
+    _t0: float = field(default=0.0, init=False, repr=False)
 
     def __enter__(self) -> "LogTimer":
-        # Запоминаем стартовое время (быстрые монотонные часы)
-        self._t0 = time.perf_counter()  # type: ignore[attr-defined]
-        # В debug-режиме может быть полезно отметить старт
-        self.logger.log(self.level, f"{self.label}...")  # простой индикатор начала
+        # Запоминаем стартовое время (быстрые монотонные часы).
+        # Строку о старте не пишем: она удваивает объём логов, а длительность есть в __exit__.
+        self._t0 = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        dt_ms = (time.perf_counter() - self._t0) * 1000.0  # type: ignore[attr-defined]
+        # Уровень выключен — не считаем длительность и не форматируем строку
+        if not self.logger.isEnabledFor(self.level):
+            return
+        dt_ms = (time.perf_counter() - self._t0) * 1000.0
         # Если был эксепшн — добавляем пометку "failed", иначе "done"
         status = "failed" if exc_type is not None else "done"
-        # Логируем результат с длительностью
-        self.logger.log(self.level, f"{self.label}: {status} in {dt_ms:.1f} ms")
+        # %-форматирование откладывается до хендлера
+        self.logger.log(self.level, "%s: %s in %.1f ms", self.label, status, dt_ms)
 
 
 # Пояснение по SRP:
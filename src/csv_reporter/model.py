@@ -63,7 +63,7 @@ class BrandStats:
     # только результат, чтобы DTO оставался простым и сериализуемым.
 
 
-@dataclass
+@dataclass(slots=True)
 class Dataset:
     """
     Контейнер для доменных объектов Product.
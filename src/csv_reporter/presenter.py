@@ -14,19 +14,29 @@ Presentation helpers (tabular output) for CSV Rating Reporter.
 - Округление среднего рейтинга до 2 знаков — компромисс читаемости.
 - Важно: передаём `disable_numparse=True`, чтобы tabulate НЕ превращал строки `"4.00"` обратно в числа `4`,
   иначе теряются нули после запятой (это ломало тест, ожидающий «4.00»).
+- Формат по умолчанию ("github") для ASCII-данных рисуем сами, тем же выводом, что и tabulate:
+  три столбца фиксированы, а generic-логика tabulate (детекция типов, диспетчеризация
+  выравнивания) здесь не нужна. tabulate импортируется лениво — только для прочих форматов.
 """
 
 from __future__ import annotations
 
-from typing import Iterable, List, Literal, Optional, Sequence, Tuple
-
-from tabulate import tabulate
+import heapq
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
 from .model import BrandStats
 
 # Разрешённые поля сортировки (явно фиксируем контракт)
 SortField = Literal["brand", "avg_rating", "items"]
 
+# Ключи сортировки: brand — по строке (a..z), avg_rating — по среднему, items — по количеству
+_SORT_KEYS: Dict[str, Callable[[BrandStats], Any]] = {
+    "brand": attrgetter("brand"),
+    "avg_rating": attrgetter("avg_rating"),
+    "items": attrgetter("items"),
+}
+
 
 class TablePresenter:
     """
@@ -63,20 +73,33 @@ class TablePresenter:
         # --- Сортировка как часть представления ---
         key_func = self._get_sort_key(sort_by)
         # Не модифицируем исходную последовательность — создаём отсортированный список
-        ordered: List[BrandStats] = sorted(rows, key=key_func, reverse=descending)
-
-        if limit is not None and limit >= 0:
-            ordered = ordered[:limit]
+        ordered: List[BrandStats]
+        if limit is not None and limit >= 0 and limit * 4 < len(rows):
+            # Нужен лишь top-K при K << N: куча даёт O(N log K) вместо полной сортировки.
+            # heapq.nlargest/nsmallest эквивалентны sorted(...)[:K], включая стабильность.
+            pick_top = heapq.nlargest if descending else heapq.nsmallest
+            ordered = pick_top(limit, rows, key=key_func)
+        else:
+            ordered = sorted(rows, key=key_func, reverse=descending)
+            if limit is not None and limit >= 0:
+                ordered = ordered[:limit]
 
         # --- Подготовка табличных данных ---
         headers = ["brand", "avg_rating", "items"]
-        table: List[Tuple[str, str, int]] = []
+        # Округляем средний рейтинг до 2 знаков для компактности и ПРИНУДИТЕЛЬНО
+        # сохраняем строкой, чтобы не потерять нули при табулировании.
+        table: List[Tuple[str, str, int]] = [
+            (r.brand, f"{r.avg_rating:.2f}", r.items) for r in ordered
+        ]
 
-        for r in ordered:
-            # Округляем средний рейтинг до 2 знаков для компактности и ПРИНУДИТЕЛЬНО
-            # сохраняем строкой, чтобы не потерять нули при табулировании.
-            avg_display = f"{r.avg_rating:.2f}"
-            table.append((r.brand, avg_display, r.items))
+        # Быстрый путь для формата по умолчанию. Не-ASCII/непечатаемые бренды отдаём tabulate:
+        # ширину широких (CJK) символов он считает через wcwidth, а len() — нет.
+        if tablefmt == "github" and all(
+            brand.isascii() and brand.isprintable() for brand, _, _ in table
+        ):
+            return self._render_github(headers, table)
+
+        from tabulate import tabulate
 
         # disable_numparse=True — критично для сохранения строкового представления "4.00"
         return tabulate(
@@ -88,19 +111,42 @@ class TablePresenter:
 
     # ----------------------- internal helpers -----------------------
 
-    def _get_sort_key(self, sort_by: SortField):
+    def _render_github(self, headers: Sequence[str], rows: Sequence[Tuple[str, str, int]]) -> str:
+        """
+        Отрисовать таблицу в формате "github" без tabulate.
+
+        Вывод совпадает с `tabulate(..., tablefmt="github", disable_numparse=True)`:
+        все столбцы выровнены влево, ширина столбца — max(len(заголовок) + 2, длина
+        самой длинной ячейки), крайние пробелы ячеек отбрасываются, без завершающего
+        перевода строки. Ожидает печатаемые ASCII-ячейки (len() == ширина на экране).
+        """
+        cells = [(brand.strip(), avg, str(items)) for brand, avg, items in rows]
+        widths = [
+            max(len(h) + 2, max((len(row[i]) for row in cells), default=0))
+            for i, h in enumerate(headers)
+        ]
+
+        lines = [
+            "| " + " | ".join(h.ljust(w) for h, w in zip(headers, widths)) + " |",
+            "|" + "|".join("-" * (w + 2) for w in widths) + "|",
+        ]
+        lines.extend(
+            "| " + " | ".join(c.ljust(w) for c, w in zip(row, widths)) + " |" for row in cells
+        )
+        return "\n".join(lines)
+
+    def _get_sort_key(self, sort_by: SortField) -> Callable[[BrandStats], Any]:
         """
         Вернуть функцию-ключ сортировки по выбранному полю.
 
         Почему не лямбда в месте вызова:
         - Так проще покрывать тестами и валидировать корректность выбора поля.
+        - Ключи — заранее созданные operator.attrgetter (реализованы в C),
+          а не новые лямбды на каждый вызов.
         """
-        if sort_by == "brand":
-            return lambda r: r.brand  # сортируем по строке бренда (a..z)
-        if sort_by == "avg_rating":
-            return lambda r: r.avg_rating  # по среднему рейтингу
-        if sort_by == "items":
-            return lambda r: r.items  # по количеству элементов
-        # Теоретически сюда не попадём, т.к. тип Literal ограничивает значения,
-        # но оставим защиту на случай изменения сигнатуры.
-        raise ValueError(f"Unsupported sort field: {sort_by!r}")
+        try:
+            return _SORT_KEYS[sort_by]
+        except KeyError:
+            # Теоретически сюда не попадём, т.к. тип Literal ограничивает значения,
+            # но оставим защиту на случай изменения сигнатуры.
+            raise ValueError(f"Unsupported sort field: {sort_by!r}") from None
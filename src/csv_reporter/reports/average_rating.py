@@ -13,10 +13,10 @@ Average Rating report implementation.
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from ..aggregator import AggregatorService
-from ..model import BrandStats, Dataset
+from ..model import BrandStats, Product
 from .base import Report
 
 
@@ -36,12 +36,12 @@ class AverageRatingReport(Report):
         """
         self._aggregator = aggregator or AggregatorService()
 
-    def generate(self, dataset: Dataset) -> Sequence[BrandStats]:
+    def generate(self, dataset: Iterable[Product]) -> Sequence[BrandStats]:
         """
         Построить отчёт.
 
         Args:
-            dataset: Набор продуктов для анализа.
+            dataset: Продукты для анализа (Dataset или поток из CSVReader.iter_products).
         Returns:
             Sequence[BrandStats]: Список статистик по брендам.
         """
@@ -3,6 +3,8 @@ Report abstraction (base class) for CSV Rating Reporter.
 
 Назначение:
 - Определяет минимальный контракт для отчётов: метод `generate(dataset)`.
+- `dataset` — любой итерируемый набор Product (Dataset или поток из CSVReader.iter_products);
+  отчёт должен обходить его не более одного раза.
 - Базовый класс не знает о CLI/презентации, только о доменных DTO.
 
 Дизайн:
@@ -11,41 +13,44 @@ Report abstraction (base class) for CSV Rating Reporter.
 - Возвращаемый тип — последовательность `BrandStats` для совместимости с presenter.
 
 Компромиссы:
-- Без generics/Protocol — здесь достаточно ABC, чтобы не усложнять типизацию.
+- Без generics/Protocol — достаточно обычного базового класса, чтобы не усложнять типизацию.
+- Без ABCMeta: `ReportRegistry.create` вызывает `cls()`, а ABCMeta добавляет к каждому
+  созданию экземпляра проверку `__abstractmethods__`. Незаполненный `generate`
+  проявится как NotImplementedError при вызове, а не TypeError при создании.
 - Если появятся отчёты с иным выходным форматом, presenter сможет поддержать ветку
   форматирования по типу элементов, но до тех пор держим единый формат.
 """
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Iterable, Sequence
 
-from ..model import BrandStats, Dataset
+from ..model import BrandStats, Product
 
 
-class Report(ABC):
+class Report:
     """
-    Абстракция отчёта.
+    Базовый класс отчёта (маркер контракта, без ABCMeta).
 
     Атрибуты класса:
         NAME: Строковый идентификатор отчёта (используется в реестре/CLI).
 
     Методы:
-        generate(dataset: Dataset) -> Sequence[BrandStats]
+        generate(dataset: Iterable[Product]) -> Sequence[BrandStats]
     """
 
     # Идентификатор должен быть переопределён в наследнике.
     NAME: str = "base-report"
 
-    @abstractmethod
-    def generate(self, dataset: Dataset) -> Sequence[BrandStats]:
+    def generate(self, dataset: Iterable[Product]) -> Sequence[BrandStats]:
         """
         Построить отчёт по данным.
 
         Args:
-            dataset: Набор продуктов для анализа.
+            dataset: Продукты для анализа (допускается однопроходный итератор).
         Returns:
             Sequence[BrandStats]: Агрегированные метрики по брендам.
+        Raises:
+            NotImplementedError: Если наследник не переопределил метод.
         """
         raise NotImplementedError
@@ -17,7 +17,8 @@ Report registry (factory by report name).
 
 from __future__ import annotations
 
-from typing import Dict, List, Type
+from functools import lru_cache
+from typing import Dict, List, Optional, Type
 
 from .base import Report
 from ..errors import ReportNotFoundError
@@ -36,6 +37,8 @@ class ReportRegistry:
 
     def __init__(self) -> None:
         self._registry: Dict[str, Type[Report]] = {}
+        # Отсортированные имена для available(); сбрасывается в register().
+        self._sorted_cache: Optional[List[str]] = None
 
     def register(self, report_cls: Type[Report]) -> None:
         """
@@ -55,6 +58,7 @@ class ReportRegistry:
         if key in self._registry:
             raise ValueError(f"Report already registered: {key}")
         self._registry[key] = report_cls
+        self._sorted_cache = None
 
     def create(self, name: str) -> Report:
         """
@@ -81,15 +85,31 @@ class ReportRegistry:
 
         Returns:
             list[str]: Отсортированный список зарегистрированных ключей.
+
+        Почему так:
+            - После старта реестр практически не меняется, поэтому сортируем один раз
+              и кешируем до следующего register().
+            - Возвращаем копию: вызывающий код может менять список, не портя кеш.
         """
-        return sorted(self._registry.keys())
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self._registry)
+        return list(self._sorted_cache)
 
 
 # -------------------- Singleton-like default registry (lazy) --------------------
 
+
 # Важно: отложенная инициализация позволяет избежать циклических импортов:
 # мы импортируем реализации отчётов только при первом обращении к реестру.
-_default_registry: ReportRegistry | None = None
+@lru_cache(maxsize=1)
+def _build_default_registry() -> ReportRegistry:
+    """Создать реестр со встроенными отчётами (результат кешируется lru_cache)."""
+    reg = ReportRegistry()
+    # Ленивая регистрация, чтобы не создавать цикл импорта:
+    from .average_rating import AverageRatingReport  # локальный импорт — только здесь
+
+    reg.register(AverageRatingReport)
+    return reg
 
 
 def get_default_registry() -> ReportRegistry:
@@ -103,16 +123,10 @@ def get_default_registry() -> ReportRegistry:
     Компромисс:
         - Не используем глобальные side-effects при импорте модуля.
           Это упрощает тестирование и ускоряет cold-start CLI.
+        - Вместо `global` + проверки на None — lru_cache(maxsize=1): попадание в кеш
+          проверяется в C, без Python-условия и без изменяемого глобального состояния.
     """
-    global _default_registry
-    if _default_registry is None:
-        reg = ReportRegistry()
-        # Ленивая регистрация, чтобы не создавать цикл импорта:
-        from .average_rating import AverageRatingReport  # локальный импорт — только здесь
-
-        reg.register(AverageRatingReport)
-        _default_registry = reg
-    return _default_registry
+    return _build_default_registry()
 
 
 def reset_default_registry() -> None:
@@ -121,5 +135,4 @@ def reset_default_registry() -> None:
 
     Это даёт возможность изолированно проверять регистрацию/расширение.
     """
-    global _default_registry
-    _default_registry = None
+    _build_default_registry.cache_clear()
@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures for CSV Rating Reporter tests.
+
+Назначение:
+- Общие входные CSV, которые нужны нескольким тестам и не меняются ими.
+
+Почему так:
+- Файлы только читаются, поэтому session-scope безопасен: пишем их один раз
+  на прогон вместо отдельного tmp_path на каждый тест.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_csv_small(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Минимальный валидный CSV: одна строка с одним брендом."""
+    path = tmp_path_factory.mktemp("data") / "a.csv"
+    path.write_text("name,brand,price,rating\nn1,BrandA,10.0,4.0\n", encoding="utf-8")
+    return path
@@ -74,7 +74,7 @@ def test_compute_brand_avg_rating(rows, expected):
     want = {bs.brand: (bs.avg_rating, bs.items) for bs in expected}
 
     # Сравниваем с допуском по плавающей точке
-    assert set(got.keys()) == set(want.keys())
+    assert got.keys() == want.keys()
     for k in want:
         avg_got, cnt_got = got[k]
         avg_want, cnt_want = want[k]
@@ -8,7 +8,8 @@ CLI argument & wiring tests for CSV Rating Reporter.
 Подход:
 - Импортируем `run` из `csv_reporter.cli` и вызываем напрямую (быстро и детерминированно).
 - Перехватываем stdout/stderr через `capsys`.
-- Временные CSV создаём в `tmp_path`, чтобы не зависеть от фикстур/репозитория.
+- Временные CSV создаём в `tmp_path`, чтобы не зависеть от фикстур/репозитория;
+  общий неизменяемый CSV берём из session-фикстуры `sample_csv_small` (conftest.py).
 
 Почему так:
 - Тесты CLI должны быть быстрыми и изолированными, без запуска подпроцессов — проще отлаживать.
@@ -39,6 +40,16 @@ def test_version_flag_prints_version_and_exits_zero(capsys: pytest.CaptureFixtur
     assert __version__ in out
 
 
+def test_version_flag_with_other_args_goes_through_argparse(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--version в сочетании с другими флагами обрабатывается полным argparse-путём."""
+    code = run(["--debug", "--version"])
+    out = capsys.readouterr().out
+    assert code == 0
+    assert __version__ in out
+
+
 def test_no_files_returns_error(capsys: pytest.CaptureFixture[str]) -> None:
     """Отсутствие --files приводит к коду 1 и сообщению об ошибке."""
     code = run([])
@@ -48,28 +59,50 @@ def test_no_files_returns_error(capsys: pytest.CaptureFixture[str]) -> None:
     assert "No input files provided" in captured.err
 
 
-def test_negative_limit_is_rejected(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+def test_negative_limit_is_rejected(
+    sample_csv_small: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Отрицательный --limit приводит к коду 1 и корректному сообщению."""
-    csv1 = tmp_path / "a.csv"
-    _write_csv(csv1, [("n1", "BrandA", "10.0", "4.0")])
-
-    code = run(["--files", str(csv1), "--limit", "-1"])
+    code = run(["--files", str(sample_csv_small), "--limit", "-1"])
     captured = capsys.readouterr()
     assert code == 1
     assert "--limit must be >= 0" in captured.err
 
 
-def test_unknown_report_returns_error(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+def test_unknown_report_returns_error(
+    sample_csv_small: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Неизвестный отчёт (OCP) корректно сообщает об ошибке и код 1."""
-    csv1 = tmp_path / "a.csv"
-    _write_csv(csv1, [("n1", "BrandA", "10.0", "4.0")])
-
-    code = run(["--files", str(csv1), "--report", "unknown"])
+    code = run(["--files", str(sample_csv_small), "--report", "unknown"])
     captured = capsys.readouterr()
     assert code == 1
     assert "Unknown report" in captured.err
 
 
+def test_unknown_report_is_reported_before_missing_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """
+    Порядок ошибок: имя отчёта проверяется до чтения файлов.
+
+    Файлы открываются лениво (iter_products), поэтому при неизвестном отчёте
+    и отсутствующем файле пользователь видит именно ошибку отчёта.
+    """
+    missing = str(tmp_path / "nope.csv")
+
+    code = run(["--files", missing, "--report", "unknown"])
+    err = capsys.readouterr().err
+    assert code == 1
+    assert "Unknown report" in err
+    assert "File not found" not in err
+
+    # С корректным отчётом та же команда сообщает об отсутствующем файле
+    code = run(["--files", missing])
+    err = capsys.readouterr().err
+    assert code == 1
+    assert "File not found" in err
+
+
 def test_successful_run_prints_table(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """
     Успешный сценарий:
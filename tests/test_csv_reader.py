@@ -0,0 +1,145 @@
+"""
+CSVReader tests: schema validation, positional column lookup and error context.
+
+Назначение:
+- Проверяет, что CSVReader находит обязательные столбцы независимо от порядка/регистра.
+- Проверяет диагностику ошибок (файл:строка) и пропуск пустых строк.
+
+Подход:
+- CSV создаём во временной директории `tmp_path`; агрегацию/CLI здесь не трогаем.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from csv_reporter.aggregator import AggregatorService
+from csv_reporter.csv_reader import CSVReader
+from csv_reporter.errors import DataError, SchemaError
+
+
+def test_columns_are_resolved_by_name_not_position(tmp_path: Path) -> None:
+    """Порядок и регистр заголовков не важны; лишние столбцы игнорируются."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text(
+        "Rating, extra ,BRAND,Price,Name\n4.5,x,Apple,999,iPhone\n\n,y,Google,799,Pixel\n",
+        encoding="utf-8",
+    )
+
+    ds = CSVReader().load([str(csv1)])
+
+    products = list(ds)
+    assert len(products) == 2  # пустая строка пропущена
+    assert products[0].name == "iPhone"
+    assert products[0].brand == "apple"
+    assert products[0].price == 999.0
+    assert products[0].rating == 4.5
+    assert products[1].rating is None
+
+
+def test_missing_required_column_raises_schema_error(tmp_path: Path) -> None:
+    """Отсутствие обязательного столбца — SchemaError с именем столбца."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text("Name, Brand,price\nn1,b,1\n", encoding="utf-8")
+
+    with pytest.raises(SchemaError, match="'rating'") as err:
+        CSVReader().load([str(csv1)])
+    # В сообщении — заголовки как в файле, без нормализации
+    assert "found: ['Name', ' Brand', 'price']" in str(err.value)
+
+
+def test_duplicate_column_uses_last_occurrence(tmp_path: Path) -> None:
+    """При повторе имени столбца (без учёта регистра) берётся последний — как в DictReader."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text("name,brand,price,rating,Rating\nn1,b,1,1,5\n", encoding="utf-8")
+
+    products = list(CSVReader().load([str(csv1)]))
+
+    assert [p.rating for p in products] == [5.0]
+
+
+def test_short_row_reports_file_and_line(tmp_path: Path) -> None:
+    """Строка короче заголовка — DataError с указанием файла и номера строки."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text("name,brand,price,rating\nn1,b,1,4\nn2,b\n", encoding="utf-8")
+
+    with pytest.raises(DataError, match=r"a\.csv:3:"):
+        CSVReader().load([str(csv1)])
+
+
+def test_error_line_is_physical_line_with_multiline_quoted_field(tmp_path: Path) -> None:
+    """Номер строки в ошибке — физический: поле в кавычках на двух строках сдвигает его."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text(
+        'name,brand,price,rating\n"multi\nline",b,1,4\nn2,b\n',
+        encoding="utf-8",
+    )
+
+    with pytest.raises(DataError, match=r"a\.csv:4: Row has too few columns"):
+        CSVReader().load([str(csv1)])
+
+
+def test_index_error_from_field_parser_is_not_reported_as_short_row(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """IndexError внутри парсеров полей не маскируется под "too few columns"."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_text("name,brand,price,rating\nn1,b,1,4\n", encoding="utf-8")
+
+    def broken_parse_price(raw: str) -> float:
+        raise IndexError("bug in parser")
+
+    monkeypatch.setattr("csv_reporter.csv_reader.parse_price", broken_parse_price)
+    with pytest.raises(IndexError, match="bug in parser"):
+        CSVReader().load([str(csv1)])
+
+
+def test_iter_products_streams_into_aggregator(tmp_path: Path) -> None:
+    """Поток из iter_products агрегируется так же, как материализованный Dataset."""
+    csv1 = tmp_path / "a.csv"
+    csv2 = tmp_path / "b.csv"
+    csv1.write_text("name,brand,price,rating\nn1,A,1,4\nn2,B,1,3\n", encoding="utf-8")
+    csv2.write_text("name,brand,price,rating\nn3,A,1,5\n", encoding="utf-8")
+    files = [str(csv1), str(csv2)]
+
+    reader = CSVReader()
+    svc = AggregatorService()
+    streamed = svc.compute_brand_avg_rating(reader.iter_products(files))
+    loaded = svc.compute_brand_avg_rating(reader.load(files))
+
+    assert streamed == loaded
+    assert {(bs.brand, bs.avg_rating, bs.items) for bs in streamed} == {
+        ("a", 4.5, 2),
+        ("b", 3.0, 1),
+    }
+
+
+def test_missing_file_and_directory_are_rejected(tmp_path: Path) -> None:
+    """Несуществующий путь и директория отклоняются до чтения данных."""
+    reader = CSVReader()
+
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        reader.load([str(tmp_path / "nope.csv")])
+    with pytest.raises(IsADirectoryError, match="Not a file"):
+        reader.load([str(tmp_path)])
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # cp1251: кириллица не является валидным UTF-8
+        "name,brand,price,rating\nТелефон,Бренд,100,4\n".encode("cp1251"),
+        # UTF-8 с BOM: BOM не должен попасть в имя первого столбца
+        "name,brand,price,rating\nТелефон,Бренд,100,4\n".encode("utf-8-sig"),
+    ],
+)
+def test_encoding_is_detected_from_file_head(tmp_path: Path, payload: bytes) -> None:
+    """Кодировка определяется по началу файла; результат одинаков для cp1251 и UTF-8 с BOM."""
+    csv1 = tmp_path / "a.csv"
+    csv1.write_bytes(payload)
+
+    products = list(CSVReader().load([str(csv1)]))
+
+    assert [(p.name, p.brand) for p in products] == [("Телефон", "бренд")]
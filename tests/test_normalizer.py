@@ -0,0 +1,85 @@
+"""
+Normalization tests for brand/price/rating parsers.
+
+Назначение:
+- Фиксирует политику нормализации отдельных полей CSV (см. normalizer.py).
+- Никакого IO: чистые функции на строках.
+
+Подход:
+- Параметризация по "грязным" вариантам входа, которые встречаются в реальных выгрузках.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from csv_reporter.errors import DataError
+from csv_reporter.normalizer import normalize_brand, parse_price, parse_rating
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("Apple", "apple"),
+        ("  Samsung   Electronics ", "samsung electronics"),
+        ("H&M\t Group\n", "h&m group"),
+    ],
+)
+def test_normalize_brand(raw: str, expected: str) -> None:
+    """Бренд приводится к нижнему регистру, пробелы схлопываются."""
+    assert normalize_brand(raw) == expected
+
+
+def test_normalize_brand_rejects_blank() -> None:
+    """Пустой бренд после нормализации — DataError."""
+    with pytest.raises(DataError):
+        normalize_brand(" \t ")
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("10.00", 10.0),
+        ("1 299", 1299.0),
+        ("12_345,50", 12345.5),
+        ("$999", 999.0),
+        ("1 299,90 ₽", 1299.9),
+    ],
+)
+def test_parse_price(raw: str, expected: float) -> None:
+    """Цена очищается от валют и разделителей тысяч; запятая — десятичный разделитель."""
+    assert parse_price(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["", "abc", "-5", "inf"])
+def test_parse_price_rejects_invalid(raw: str) -> None:
+    """Пустая, нечисловая или отрицательная цена — DataError."""
+    with pytest.raises(DataError):
+        parse_price(raw)
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("4.5", 4.5),
+        ("4,5", 4.5),
+        (" 5 ", 5.0),
+        ("", None),
+        ("N/A", None),
+    ],
+)
+def test_parse_rating(raw: str, expected: float | None) -> None:
+    """Рейтинг парсится в [0, 5]; пустые и NA-значения дают None."""
+    assert parse_rating(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["5.1", "-1", "nan", "good"])
+def test_parse_rating_rejects_invalid(raw: str) -> None:
+    """Рейтинг вне диапазона или нечисловой — DataError."""
+    with pytest.raises(DataError):
+        parse_rating(raw)
+
+
+def test_normalize_brand_returns_interned_string() -> None:
+    """Одинаковые бренды из разных строк дают один и тот же объект str."""
+    assert normalize_brand(" Apple ") is normalize_brand("APPLE")
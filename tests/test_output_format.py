@@ -7,68 +7,105 @@ Presentation (table formatting) tests for TablePresenter.
 
 Подход:
 - Создаём список BrandStats вручную — без агрегации/CSV (SRP).
-- Проверяем разные поля сортировки и limit.
+- Проверяем разные поля сортировки и limit (параметризация, один presenter на модуль).
 """
 
 from __future__ import annotations
 
+import re
+
+import pytest
+
 from csv_reporter.model import BrandStats
 from csv_reporter.presenter import TablePresenter
 
+# Фиксированный набор DTO для тестов форматирования.
+# Presenter не меняет входную последовательность, поэтому кортеж безопасно разделять между тестами.
+_ROWS: tuple[BrandStats, ...] = (
+    BrandStats(brand="alpha", avg_rating=4.251, items=3),
+    BrandStats(brand="gamma", avg_rating=3.999, items=10),
+    BrandStats(brand="beta", avg_rating=4.75, items=2),
+)
+# Бренды из _ROWS: порядок строк таблицы проверяем одним проходом по выводу
+_BRAND_RE = re.compile(r"alpha|beta|gamma")
 
-def _mk_rows() -> list[BrandStats]:
-    """Утилита: фиксированный набор DTO для тестов форматирования."""
-    return [
-        BrandStats(brand="alpha", avg_rating=4.251, items=3),
-        BrandStats(brand="gamma", avg_rating=3.999, items=10),
-        BrandStats(brand="beta", avg_rating=4.75, items=2),
-    ]
-
-
-def test_sort_by_avg_rating_desc_default():
-    """По умолчанию сортируем по avg_rating по убыванию, округление до 2 знаков."""
-    presenter = TablePresenter()
-    out = presenter.render_brand_stats(_mk_rows())
-    # Ожидаемый порядок: beta (4.75), alpha (4.25), gamma (4.00 после округления)
-    beta_pos = out.find("beta")
-    alpha_pos = out.find("alpha")
-    gamma_pos = out.find("gamma")
-    assert beta_pos < alpha_pos < gamma_pos
-    # Проверяем округление:
-    assert "4.75" in out
-    assert "4.25" in out
-    assert "4.00" in out
-
-
-def test_sort_by_brand_ascending():
-    """Сортировка по полю brand (по алфавиту), убывание=False (прямой порядок)."""
-    presenter = TablePresenter()
-    out = presenter.render_brand_stats(
-        _mk_rows(),
-        sort_by="brand",
-        descending=False,
-    )
-    # Ожидаем: alpha, beta, gamma
-    alpha_pos = out.find("alpha")
-    beta_pos = out.find("beta")
-    gamma_pos = out.find("gamma")
-    assert alpha_pos < beta_pos < gamma_pos
-
-
-def test_sort_by_items_then_limit_two():
-    """Сортировка по items (по убыванию) и ограничение вывода до 2 строк."""
-    presenter = TablePresenter()
-    out = presenter.render_brand_stats(
-        _mk_rows(),
-        sort_by="items",
-        descending=True,
-        limit=2,
+
+@pytest.fixture(scope="module")
+def presenter() -> TablePresenter:
+    """TablePresenter без состояния — один экземпляр на модуль."""
+    return TablePresenter()
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_order,expected_ratings",
+    [
+        # По умолчанию: avg_rating по убыванию; gamma = 4.00 после округления
+        ({}, ["beta", "alpha", "gamma"], {"4.75", "4.25", "4.00"}),
+        # По brand в прямом порядке (a..z)
+        (
+            {"sort_by": "brand", "descending": False},
+            ["alpha", "beta", "gamma"],
+            {"4.75", "4.25", "4.00"},
+        ),
+        # По items по убыванию и limit=2: gamma(10), alpha(3); beta(2) отсечена
+        (
+            {"sort_by": "items", "descending": True, "limit": 2},
+            ["gamma", "alpha"],
+            {"4.00", "4.25"},
+        ),
+    ],
+    ids=["avg-rating-desc-default", "brand-asc", "items-desc-limit-2"],
+)
+def test_render_sort_and_limit(
+    presenter: TablePresenter,
+    kwargs: dict,
+    expected_order: list[str],
+    expected_ratings: set[str],
+) -> None:
+    """Сортировка, limit и округление до 2 знаков для разных параметров вывода."""
+    out = presenter.render_brand_stats(_ROWS, **kwargs)
+
+    assert [m.group() for m in _BRAND_RE.finditer(out)] == expected_order
+    # Заголовок + разделитель + строки данных: лишних брендов в выводе нет
+    assert out.count("\n") == 1 + len(expected_order)
+    # Проверяем округление одним проходом: в таблице ровно эти значения с 2 знаками
+    assert set(re.findall(r"\d\.\d{2}", out)) == expected_ratings
+
+
+def test_small_limit_on_many_rows_keeps_sorted_order(presenter: TablePresenter) -> None:
+    """Top-K при K много меньше N (путь через heapq) совпадает с полной сортировкой."""
+    # 7*i mod 50 различны при i < 50 — порядок однозначен
+    rows = [BrandStats(brand=f"b{i:02d}", avg_rating=(i * 7 % 50) / 10, items=i) for i in range(40)]
+    out = presenter.render_brand_stats(rows, sort_by="avg_rating", descending=True, limit=3)
+
+    expected = sorted(rows, key=lambda r: r.avg_rating, reverse=True)[:3]
+    positions = [out.find(r.brand) for r in expected]
+    assert all(p >= 0 for p in positions)
+    assert positions == sorted(positions)
+    assert out.count("\n") == 3 + 1  # заголовок + разделитель + 3 строки данных
+
+
+def test_default_github_output_matches_tabulate(presenter: TablePresenter) -> None:
+    """Собственный рендер формата github совпадает с tabulate байт-в-байт."""
+    from tabulate import tabulate
+
+    rows = sorted(
+        [*_ROWS, BrandStats(brand="samsung electronics", avg_rating=5.0, items=12345)],
+        key=lambda r: r.brand,
     )
-    # gamma(items=10) должна быть первой; всего 2 строки данных
-    assert "gamma" in out
-    # Подсчитываем количество разделителей строк '|' c данными (не считаем заголовок).
-    # Формат 'github' рисует таблицу с линиями; проще проверить наличие второй строки бренда.
-    assert "alpha" in out or "beta" in out
-    # Но третьего бренда быть не должно
-    remaining = {"alpha", "beta"} - {b for b in ["alpha", "beta"] if b in out}
-    assert len(remaining) == 1  # ровно один из alpha/beta отсутствует => 2 строки данных
+    for data in (rows, []):
+        expected = tabulate(
+            [(r.brand, f"{r.avg_rating:.2f}", r.items) for r in data],
+            headers=["brand", "avg_rating", "items"],
+            tablefmt="github",
+            disable_numparse=True,
+        )
+        assert presenter.render_brand_stats(data, sort_by="brand", descending=False) == expected
+
+
+def test_non_ascii_brands_and_other_formats_use_tabulate(presenter: TablePresenter) -> None:
+    """Не-ASCII бренды и форматы кроме github форматируются через tabulate."""
+    rows = [BrandStats(brand="бренд", avg_rating=4.0, items=1)]
+
+    assert "| бренд   | 4.00" in presenter.render_brand_stats(rows)
+    assert "+-" in presenter.render_brand_stats(rows, tablefmt="grid")
@@ -8,15 +8,17 @@ Tests for ReportRegistry and report classes (average-rating).
 
 Подход:
 - Используем reset_default_registry() для изоляции тестов.
-- Создаём временный фейковый отчёт для проверки регистрации.
-- Мокаем AggregatorService, чтобы убедиться, что вызов делегируется.
+- Фейковый отчёт `_DummyReport` объявлен на уровне модуля и регистрируется только в пустом реестре.
+- Подменяем AggregatorService простым объектом (SimpleNamespace), чтобы убедиться,
+  что вызов делегируется.
 """
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
-from csv_reporter.aggregator import AggregatorService
 from csv_reporter.errors import ReportNotFoundError
 from csv_reporter.model import Dataset
 from csv_reporter.reports.average_rating import AverageRatingReport
@@ -28,31 +30,56 @@ from csv_reporter.reports.registry import (
 )
 
 
-def test_registry_register_and_create_works(monkeypatch):
-    """Регистрируем новый отчёт и создаём его экземпляр."""
-    reg = ReportRegistry()
+class _DummyReport(Report):
+    """Фейковый отчёт без состояния — только для проверки регистрации."""
+
+    NAME = "dummy"
+
+    def generate(self, dataset: Dataset):  # pragma: no cover
+        return []
 
-    class DummyReport(Report):
-        NAME = "dummy"
 
-        def generate(self, dataset: Dataset):  # pragma: no cover
-            return []
+@pytest.fixture
+def empty_registry() -> ReportRegistry:
+    """Пустой реестр на каждый тест: регистрации одного теста не видны другим."""
+    return ReportRegistry()
+
+
+def test_registry_register_and_create_works(empty_registry: ReportRegistry):
+    """Регистрируем новый отчёт и создаём его экземпляр."""
+    reg = empty_registry
 
-    reg.register(DummyReport)
-    created = reg.create("dummy")
-    assert isinstance(created, DummyReport)
+    reg.register(_DummyReport)
+    assert isinstance(reg.create("dummy"), _DummyReport)
     assert "dummy" in reg.available()
 
     # Повторная регистрация того же имени должна вызвать ошибку
     with pytest.raises(ValueError):
-        reg.register(DummyReport)
+        reg.register(_DummyReport)
 
 
-def test_registry_unknown_report_raises():
+def test_registry_available_is_refreshed_after_register(empty_registry: ReportRegistry):
+    """Кеш available() сбрасывается при регистрации; внешние изменения списка его не портят."""
+    reg = empty_registry
+
+    class ZReport(Report):
+        NAME = "z-report"
+
+    class AReport(Report):
+        NAME = "a-report"
+
+    reg.register(ZReport)
+    reg.available().append("junk")
+    assert reg.available() == ["z-report"]
+
+    reg.register(AReport)
+    assert reg.available() == ["a-report", "z-report"]
+
+
+def test_registry_unknown_report_raises(empty_registry: ReportRegistry):
     """Неизвестное имя вызывает ReportNotFoundError."""
-    reg = ReportRegistry()
     with pytest.raises(ReportNotFoundError):
-        reg.create("nope")
+        empty_registry.create("nope")
 
 
 def test_default_registry_lazy_load_and_reset(monkeypatch):
@@ -68,17 +95,19 @@ def test_default_registry_lazy_load_and_reset(monkeypatch):
     assert reg1 is not reg2
 
 
-def test_average_rating_report_delegates_to_aggregator(monkeypatch):
+def test_average_rating_report_delegates_to_aggregator():
     """AverageRatingReport вызывает AggregatorService.compute_brand_avg_rating."""
     called = {}
 
-    class FakeAgg(AggregatorService):
-        def compute_brand_avg_rating(self, dataset: Dataset):  # type: ignore[override]
-            called["ok"] = True
-            return ["stub-result"]
+    def fake_compute(dataset):
+        called["dataset"] = dataset
+        return ["stub-result"]
+
+    # Утиная типизация: отчёту нужен лишь метод compute_brand_avg_rating
+    fake = SimpleNamespace(compute_brand_avg_rating=fake_compute)
 
     ds = Dataset()
-    rep = AverageRatingReport(aggregator=FakeAgg())
+    rep = AverageRatingReport(aggregator=fake)  # type: ignore[arg-type]
     out = rep.generate(ds)
-    assert called["ok"]
+    assert called["dataset"] is ds
     assert out == ["stub-result"]